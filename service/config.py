@@ -14,6 +14,15 @@ DATABASE_URI = os.getenv(
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 # SQLALCHEMY_POOL_SIZE = 2
+if not DATABASE_URI.startswith("sqlite"):
+    # Reuse a fixed set of live connections; in-memory SQLite already
+    # gets a StaticPool from Flask-SQLAlchemy, which takes no sizing
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 0,
+        "pool_pre_ping": True,
+        "pool_recycle": -1,
+    }
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
@@ -0,0 +1,200 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared pytest fixtures for the test suite
+
+The database schema is created once per test run and every test that asks
+for ``db_session`` runs inside a transaction that is rolled back afterwards.
+Read-only tests grouped in a class can share ``seeded_products`` and
+``priced_products``, which are rolled back once the whole class has run.
+
+The database comes from the DATABASE_URI environment variable or else the
+``database_uri`` ini option, and defaults to in-memory SQLite.
+
+The suite can be run in parallel with:
+    pytest -n auto
+"""
+import os
+import logging
+from decimal import Decimal
+from typing import Optional
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+# NOTE: The service connects to the database as soon as it is imported, so
+# nothing from service or tests may be imported here at module level. The
+# database is resolved in pytest_configure(), before any test module loads
+# pylint: disable=import-outside-toplevel
+
+DATABASE_URI_KEY = pytest.StashKey[str]()
+SAVED_DATABASE_URI_KEY = pytest.StashKey[Optional[str]]()
+
+
+def _worker_database_uri(uri: str) -> str:
+    """Gives each pytest-xdist worker a PostgreSQL database of its own
+
+    Workers are named gw0, gw1, ... so postgres becomes postgres_gw0 etc.
+    The database is created on first use through the connection in uri.
+    A uri without a database name falls back to the user name, as psql does
+
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    url = make_url(uri)
+    if not worker or url.get_backend_name() == "sqlite":
+        return uri  # in-memory SQLite is already private to each worker
+    # PostgreSQL connects to the database named after the user when none is given
+    database = url.database or url.username or "postgres"
+    worker_url = url.set(database=f"{database}_{worker}")
+    engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        found = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": worker_url.database},
+        ).scalar()
+        if not found:
+            connection.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    engine.dispose()
+    return worker_url.render_as_string(hide_password=False)
+
+
+######################################################################
+#  H O O K S
+######################################################################
+def pytest_addoption(parser):
+    """Registers the database_uri ini option"""
+    # The model tests only need CRUD and equality filters, so they default
+    # to an in-memory SQLite database. Point this, or the DATABASE_URI
+    # environment variable, at PostgreSQL to test against it
+    parser.addini(
+        "database_uri",
+        "Database to test against when DATABASE_URI is not set",
+        default="sqlite:///:memory:",
+    )
+
+
+def pytest_configure(config):
+    """Resolves the test database once per process
+
+    The result is exported as DATABASE_URI for the service to pick up on
+    import, and xdist workers inherit it from the controlling process
+
+    """
+    config.stash[SAVED_DATABASE_URI_KEY] = os.getenv("DATABASE_URI")
+    uri = os.getenv("DATABASE_URI") or config.getini("database_uri")
+    uri = _worker_database_uri(uri)
+    os.environ["DATABASE_URI"] = uri
+    config.stash[DATABASE_URI_KEY] = uri
+
+
+def pytest_unconfigure(config):
+    """Puts back the DATABASE_URI the process had before the test run"""
+    saved = config.stash.get(SAVED_DATABASE_URI_KEY, None)
+    if saved is None:
+        os.environ.pop("DATABASE_URI", None)
+    else:
+        os.environ["DATABASE_URI"] = saved
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+@pytest.fixture(scope="session")
+def database_uri(request):
+    """The database the test run was configured to use"""
+    return request.config.stash[DATABASE_URI_KEY]
+
+
+@pytest.fixture(scope="session")
+def app_db(database_uri):  # pylint: disable=redefined-outer-name
+    """Prepares the database once for the entire test run"""
+    from service import app
+    from service.models import Product, db
+
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.logger.setLevel(logging.CRITICAL)
+    # The service initialized the database when it was imported, and Flask
+    # refuses to initialize it again once the app has served a request
+    assert db.engine.url == make_url(database_uri), "service connected to another database"
+    db.create_all()
+    # Start empty in case tests that commit (e.g. the route tests) ran first
+    db.session.query(Product).delete()
+    db.session.commit()
+    yield db
+
+
+def _rollback_session(database, **options):
+    """Binds db.session to a transaction that is rolled back when done"""
+    connection = database.engine.connect()
+    trans = connection.begin()
+    session = scoped_session(sessionmaker(bind=connection, **options))
+    old_session = database.session
+    database.session = session
+    yield session
+    session.remove()
+    database.session = old_session
+    trans.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(app_db):  # pylint: disable=redefined-outer-name
+    """Rolls back everything a single test writes"""
+    yield from _rollback_session(app_db)
+
+
+@pytest.fixture(scope="class")
+def db_session_class(app_db):  # pylint: disable=redefined-outer-name
+    """Rolls back everything a test class writes once the class is done"""
+    # The class's tests only read, and its fixtures flush explicitly,
+    # so skip the autoflush check before every query
+    yield from _rollback_session(app_db, autoflush=False)
+
+
+@pytest.fixture(scope="class")
+def seeded_products(db_session_class):  # pylint: disable=redefined-outer-name,unused-argument
+    """Creates one batch of Products shared by the read-only tests of a class"""
+    from service.models import Category
+    from tests.factories import fast_product
+    from tests.helpers import bulk_create
+
+    # Two values per field keep the expected counts deterministic
+    return bulk_create(
+        [
+            fast_product(
+                i,
+                available=i % 2 == 0,
+                category=Category.FOOD if i % 3 == 0 else Category.CLOTHS,
+            )
+            for i in range(10)
+        ]
+    )
+
+
+@pytest.fixture(scope="class")
+def priced_products(db_session_class):  # pylint: disable=redefined-outer-name,unused-argument
+    """Creates Products with known prices shared by the price query tests"""
+    from tests.factories import ProductFactory
+    from tests.helpers import bulk_create
+
+    return bulk_create(
+        [
+            ProductFactory(price=Decimal("9.99")),
+            ProductFactory(price=Decimal("19.99")),
+            ProductFactory(price=Decimal("9.99")),  # Same price as the first one
+        ]
+    )
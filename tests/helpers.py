@@ -0,0 +1,36 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helper functions shared by the test cases
+"""
+from service.models import db
+
+
+def bulk_create(products: list) -> list:
+    """Adds a batch of Products to the database in a single flush
+
+    :param products: the Products to persist
+    :type products: list
+
+    :return: the same Products with their ids assigned
+    :rtype: list
+
+    """
+    for product in products:
+        # id must be none to generate next primary key
+        product.id = None
+    db.session.add_all(products)
+    db.session.flush()
+    return products
@@ -0,0 +1,67 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+SQL query counter for the test cases
+
+Records every statement sent to the database so tests can guard against
+N+1 query regressions, e.g.:
+
+    with assert_max_queries(2):
+        found = Product.find_by_category(category).all()
+
+"""
+from contextlib import contextmanager
+from sqlalchemy import event
+from service.models import db
+
+
+@contextmanager
+def count_queries(connection=None):
+    """Collects the SQL statements executed on a connection or engine
+
+    :param connection: the Connection or Engine to listen on, defaults to db.engine
+
+    :return: the list of statements executed inside the block
+    :rtype: list
+
+    """
+    if connection is None:
+        connection = db.engine
+    queries = []
+
+    def _callback(_conn, _cursor, statement, *_args):
+        queries.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _callback)
+    try:
+        yield queries
+    finally:
+        event.remove(connection, "before_cursor_execute", _callback)
+
+
+@contextmanager
+def assert_max_queries(count: int, connection=None):
+    """Fails if the block executes more than count SQL statements
+
+    :param count: the maximum number of statements allowed
+    :type count: int
+    :param connection: the Connection or Engine to listen on, defaults to db.engine
+
+    """
+    with count_queries(connection) as queries:
+        yield queries
+    assert len(queries) <= count, (
+        f"Expected at most {count} queries, got {len(queries)}:\n" + "\n".join(queries)
+    )